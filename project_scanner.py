@@ -8,10 +8,28 @@ organization or sharing code structure.
 Scans text files with configurable inclusion or exclusion lists and supports document formats.
 """
 
+import difflib
+import hashlib
+import io
+import json
 import os
+import re
+import shutil
+import struct
+import subprocess
 import sys
+import tracemalloc
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Set, Optional, TextIO, Dict, Any
+from typing import List, Set, Optional, TextIO, Dict, Any, Tuple, Callable, Iterator
 from datetime import datetime
 from dataclasses import dataclass, field
 from enum import Enum
@@ -51,10 +69,72 @@ DEFAULT_EXCLUDED_DIRS = {
     ".idea", ".vs", ".vscode", ".pytest_cache", 
 }
 
+# Checkpoint defaults (resumable scans)
+DEFAULT_CHECKPOINT_INTERVAL = 100  # Files processed between checkpoints
+CHECKPOINT_SUFFIX = ".checkpoint"
+CHECKPOINT_FILES_SUFFIX = ".files"  # File list written once next to the checkpoint
+CHECKPOINT_VERSION = 2
+
+# Delta scan manifest format
+MANIFEST_VERSION = 1
+MANIFEST_HASH_CHUNK_SIZE = 1024 * 1024  # Bytes read at a time when hashing files
+
+# Batch scanning defaults
+DEFAULT_BATCH_WORKERS = 4        # Jobs scanned concurrently
+DEFAULT_BATCH_IO_LIMIT = 8       # Files read concurrently across all jobs
+
 # Content display defaults
 DEFAULT_MAX_FILE_SIZE_KB = 1024  # 1MB limit
 DEFAULT_MAX_LINE_COUNT = 1000    # 1000 lines per file
 
+# Outline mode defaults (files with these extensions are summarized by their API)
+DEFAULT_OUTLINE_EXTENSIONS = set()  # No outlining by default
+OUTLINE_SUPPORTED_EXTENSIONS = {".gd"}
+DEFAULT_OUTLINE_FLAG_VALUE = ".gd"  # Extensions outlined when --outline is given without a value
+
+# Parallel directory traversal defaults
+DEFAULT_WALK_WORKERS = 8  # Walker threads used when parallel traversal is requested
+
+# Directory aggregate defaults (per-directory totals and collapsing of huge directories)
+DEFAULT_SHOW_DIRECTORY_AGGREGATES = False
+DEFAULT_COLLAPSE_THRESHOLD = 200      # Directly contained files above which a directory is collapsed
+AGGREGATE_BUFFER_SIZE = 1024 * 1024   # Subtree output kept in memory before spilling to disk
+AGGREGATE_TOP_EXTENSIONS = 5          # Extensions listed in a directory's breakdown
+
+# Archive defaults (archives are listed and read as virtual directories when enabled)
+DEFAULT_SCAN_ARCHIVES = False
+ZIP_ARCHIVE_SUFFIXES = ('.zip',)
+TAR_ARCHIVE_SUFFIXES = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+MAX_OPEN_ARCHIVES = 4  # Archives kept open between member reads
+
+# Asset summary defaults (image/art source metadata read from file headers only)
+DEFAULT_SHOW_ASSET_SUMMARY = False
+ASSET_METADATA_EXTENSIONS = {'.png', '.gif', '.webp', '.psd', '.ase', '.aseprite'}
+PNG_COLOR_TYPES = {0: "Gray", 2: "RGB", 3: "Indexed", 4: "Gray+Alpha", 6: "RGBA"}
+PSD_COLOR_MODES = {0: "Bitmap", 1: "Grayscale", 2: "Indexed", 3: "RGB", 4: "CMYK",
+                   7: "Multichannel", 8: "Duotone", 9: "Lab"}
+ASEPRITE_COLOR_DEPTHS = {8: "Indexed", 16: "Grayscale", 32: "RGBA"}
+
+# GDScript outline patterns
+GDSCRIPT_DECLARATION_PATTERN = re.compile(
+    r'^(?:@tool\b|@icon\b|extends\b|class_name\b|class\s|signal\b|const\b|enum\b|(?:static\s+)?func\b'
+    r'|@export_(?:group|subgroup|category)\b'
+    r'|@export(?!_(?:group|subgroup|category)\b)\w*(?:\(.*\))?\s+(?:@\w+(?:\(.*\))?\s+)*var\b)'
+)
+# Export annotations carried onto the next var; group and category annotations stand on their own
+GDSCRIPT_EXPORT_ANNOTATION_PATTERN = re.compile(r'^@export(?!_(?:group|subgroup|category)\b)\w*(?:\(.*\))?$')
+GDSCRIPT_FUNC_SIGNATURE_PATTERN = re.compile(r'^(.*?\))\s*(->\s*[^:]+?)?\s*:')
+# String literals and comments, masked before brackets are counted
+GDSCRIPT_STRING_PATTERN = re.compile(
+    r'("""|\'\'\')(?:\\.|[^\\])*?\1'      # Triple-quoted string closed on the same line
+    r'|(?P<open>"""|\'\'\').*'            # Triple-quoted string continuing on the next lines
+    r'|"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|#.*'
+)
+GDSCRIPT_STRING_END_PATTERNS = {
+    '"""': re.compile(r'(?:\\.|[^\\])*?"""'),
+    "'''": re.compile(r"(?:\\.|[^\\])*?'''"),
+}
+
 
 @dataclass
 class DocumentSupport:
@@ -124,6 +204,242 @@ class DocumentSupport:
         return "\n".join(status_lines)
 
 
+def format_size(size_bytes: int) -> str:
+    """Format a byte count for display."""
+    size = float(size_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+@dataclass
+class DirectoryAggregate:
+    """File count, total size and per-extension breakdown of a directory subtree."""
+    file_count: int = 0
+    total_bytes: int = 0
+    direct_files: int = 0
+    extension_counts: Dict[str, int] = field(default_factory=dict)
+    collapsed: bool = False
+    
+    def add_file(self, extension: str, size: int) -> None:
+        """Count a file directly contained in the directory."""
+        self.file_count += 1
+        self.direct_files += 1
+        self.total_bytes += size
+        key = extension or "(none)"
+        self.extension_counts[key] = self.extension_counts.get(key, 0) + 1
+    
+    def merge(self, other: "DirectoryAggregate") -> None:
+        """Add the totals of a subdirectory."""
+        self.file_count += other.file_count
+        self.total_bytes += other.total_bytes
+        for extension, count in other.extension_counts.items():
+            self.extension_counts[extension] = self.extension_counts.get(extension, 0) + count
+    
+    def describe(self) -> str:
+        """Summarize the totals, listing the most common extensions."""
+        top = sorted(self.extension_counts.items(), key=lambda item: (-item[1], item[0]))
+        breakdown = ", ".join(f"{ext} {count}" for ext, count in top[:AGGREGATE_TOP_EXTENSIONS])
+        if len(top) > AGGREGATE_TOP_EXTENSIONS:
+            breakdown += f", +{len(top) - AGGREGATE_TOP_EXTENSIONS} more"
+        summary = f"{self.file_count} files, {format_size(self.total_bytes)}"
+        return f"{summary}: {breakdown}" if breakdown else summary
+
+
+class FileCatalog:
+    """
+    Compact, append-only list of scanned files.
+    
+    Directory prefixes are interned once; file names are packed into a single
+    UTF-8 buffer addressed by an offset array, and sizes/modification times
+    live in typed arrays. Entries are addressed by index and only turned into
+    Path objects when a stage needs one, so million-file trees do not keep a
+    Path object per file alive.
+    """
+    
+    UNKNOWN = -1  # Size/mtime not recorded yet
+    
+    def __init__(self):
+        self._directories: List[Path] = []
+        self._directory_ids: Dict[Path, int] = {}
+        self._directory_index = array('I')
+        self._names = bytearray()
+        self._name_offsets = array('Q', [0])
+        self._sizes = array('q')
+        self._mtimes = array('q')
+        
+        # Siblings are added in a row, so the last directory is checked by identity first
+        self._last_directory: Optional[Path] = None
+        self._last_directory_id = 0
+    
+    def add(self, path: Path, size: int = UNKNOWN, mtime_ns: int = UNKNOWN) -> int:
+        """
+        Add a file and return its index.
+        
+        Args:
+            path: Path of the file
+            size: File size in bytes if already known
+            mtime_ns: Modification time in nanoseconds if already known
+        """
+        return self.add_entry(path.parent, path.name, size, mtime_ns)
+    
+    def add_entry(self, directory: Path, name: str, size: int = UNKNOWN, mtime_ns: int = UNKNOWN) -> int:
+        """
+        Add a file by its directory and name and return its index.
+        
+        Passing the same directory object for all files of a directory avoids
+        hashing a new parent path per file.
+        """
+        if directory is not self._last_directory:
+            directory_id = self._directory_ids.get(directory)
+            if directory_id is None:
+                directory_id = len(self._directories)
+                self._directories.append(directory)
+                self._directory_ids[directory] = directory_id
+            self._last_directory, self._last_directory_id = directory, directory_id
+        
+        self._directory_index.append(self._last_directory_id)
+        self._names += name.encode('utf-8', 'surrogateescape')
+        self._name_offsets.append(len(self._names))
+        self._sizes.append(size)
+        self._mtimes.append(mtime_ns)
+        return len(self._directory_index) - 1
+
+    def __len__(self) -> int:
+        return len(self._directory_index)
+    
+    def name(self, index: int) -> str:
+        """File name of an entry."""
+        start, end = self._name_offsets[index], self._name_offsets[index + 1]
+        return self._names[start:end].decode('utf-8', 'surrogateescape')
+    
+    def path(self, index: int) -> Path:
+        """Path of an entry, created on demand."""
+        return self._directories[self._directory_index[index]] / self.name(index)
+    
+    __getitem__ = path
+    
+    def __iter__(self) -> Iterator[Path]:
+        for index in range(len(self)):
+            yield self.path(index)
+    
+    def stat(self, index: int) -> Tuple[int, int]:
+        """Size and modification time of an entry, read from the filesystem on first use."""
+        if self._sizes[index] == self.UNKNOWN:
+            stat = self.path(index).stat()
+            self._sizes[index] = stat.st_size
+            self._mtimes[index] = stat.st_mtime_ns
+        return self._sizes[index], self._mtimes[index]
+    
+    def index_of(self, path: Path) -> Optional[int]:
+        """Find the index of a path (compared as absolute paths), or None."""
+        directory, name = path.absolute().parent, path.name
+        directory_ids = {directory_id for directory_id, candidate in enumerate(self._directories)
+                         if candidate.absolute() == directory}
+        if not directory_ids:
+            return None
+        for index, directory_id in enumerate(self._directory_index):
+            if directory_id in directory_ids and self.name(index) == name:
+                return index
+        return None
+
+
+def benchmark_file_catalog(file_counts: Tuple[int, ...] = (100_000, 1_000_000)) -> str:
+    """
+    Compare memory use of a Path list and a FileCatalog for synthetic trees.
+    
+    Entries are generated the way the directory walk adds them: 100 files
+    per directory, nested three levels deep. Memory is the tracemalloc peak;
+    build time is measured in a separate untraced run.
+    
+    Args:
+        file_counts: Number of files per benchmark run
+        
+    Returns:
+        Text table of peak traced memory and build time
+    """
+    root = Path("/project")
+    
+    def build_list(count: int) -> List[Path]:
+        files = []
+        for i in range(count):
+            if i % 100 == 0:
+                directory = root / f"assets_{i // 1_000_000}" / f"pack_{i // 10_000}" / f"dir_{i // 100}"
+            files.append(directory / f"sprite_{i:07d}.png")
+        return files
+    
+    def build_catalog(count: int) -> FileCatalog:
+        catalog = FileCatalog()
+        for i in range(count):
+            if i % 100 == 0:
+                directory = root / f"assets_{i // 1_000_000}" / f"pack_{i // 10_000}" / f"dir_{i // 100}"
+            catalog.add_entry(directory, f"sprite_{i:07d}.png")
+        return catalog
+    
+    lines = [f"{'Files':>10}  {'Path list':>12}  {'FileCatalog':>12}  {'Saved':>6}  {'List time':>9}  {'Catalog time':>12}"]
+    for count in file_counts:
+        results = []
+        for build in (build_list, build_catalog):
+            start = time.perf_counter()
+            container = build(count)
+            elapsed = time.perf_counter() - start
+            del container
+            
+            tracemalloc.start()
+            container = build(count)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del container
+            results.append((peak, elapsed))
+        
+        (list_peak, list_time), (catalog_peak, catalog_time) = results
+        lines.append(f"{count:>10}  {format_size(list_peak):>12}  {format_size(catalog_peak):>12}  "
+                     f"{1 - catalog_peak / list_peak:>6.0%}  {list_time:>8.2f}s  {catalog_time:>11.2f}s")
+    
+    return "\n".join(lines)
+
+
+class _NullOutput:
+    """Output sink discarding everything written to it."""
+    
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+class DocumentCache:
+    """Thread-safe cache of extracted document text, shared between scanners."""
+    
+    def __init__(self):
+        self._entries: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+    
+    def get_or_extract(self, file_path: Path, extract: Callable[[], str]) -> str:
+        """
+        Return the cached text for a file or extract and store it.
+        
+        Entries are keyed by absolute path, size and modification time, so
+        changed files are extracted again.
+        
+        Args:
+            file_path: Path to the document
+            extract: Function extracting the document text
+            
+        Returns:
+            Extracted document text
+        """
+        stat = file_path.stat()
+        key = (str(file_path.absolute()), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+        
+        text = extract()
+        with self._lock:
+            self._entries[key] = text
+        return text
+
+
 class ScannerConfigError(Exception):
     """Exception raised for configuration errors in the scanner."""
     pass
@@ -160,6 +476,35 @@ class ScannerConfig:
     # Document support
     doc_support: DocumentSupport
     
+    # Extensions rendered as declaration outlines instead of full contents
+    outline_extensions: Set[str] = field(default_factory=set)
+    
+    # Git-aware scanning (file list taken from git instead of walking the tree)
+    git_mode: bool = False
+    git_since: Optional[str] = None      # Only files changed since this ref
+    git_revision: Optional[str] = None   # Read files from this revision instead of the working tree
+    
+    # Treat .zip/.tar archives as virtual directories
+    scan_archives: bool = False
+    
+    # Per-directory table of image dimensions and formats read from file headers
+    show_asset_summary: bool = False
+    
+    # Directory totals in the structure, collapsing directories with more direct files than the threshold
+    show_directory_aggregates: bool = False
+    collapse_threshold: Optional[int] = None
+    
+    # Threads listing directories ahead of the walk (None or 1 walks on the calling thread only)
+    walk_workers: Optional[int] = None
+    
+    # Resumable scans: checkpoint every N processed files (None disables checkpoints)
+    checkpoint_interval: Optional[int] = None
+    resume: bool = False
+    
+    # Delta scans: compare against a previous manifest and/or save a manifest of this scan
+    delta_manifest: Optional[Path] = None
+    save_manifest: Optional[Path] = None
+    
     def __post_init__(self):
         """Validate and normalize the configuration."""
         # Validate directory
@@ -195,6 +540,74 @@ class ScannerConfig:
         # If in include mode, we should have included extensions
         if self.filter_mode == FilterMode.INCLUDE and not self.included_extensions:
             raise ScannerConfigError("When using INCLUDE filter mode, included_extensions cannot be empty")
+            
+        # Validate outline extensions
+        unsupported = set(self.outline_extensions) - OUTLINE_SUPPORTED_EXTENSIONS
+        if unsupported:
+            raise ScannerConfigError(
+                f"Outline mode not supported for: {', '.join(sorted(unsupported))} "
+                f"(supported: {', '.join(sorted(OUTLINE_SUPPORTED_EXTENSIONS))})"
+            )
+            
+        # A ref or revision implies git mode
+        if self.git_since or self.git_revision:
+            self.git_mode = True
+            
+        # Validate parallel traversal
+        if self.walk_workers is not None and self.walk_workers <= 0:
+            raise ScannerConfigError("walk_workers must be positive if specified")
+        if self.walk_workers is not None and self.git_mode:
+            raise ScannerConfigError("Walk workers cannot be combined with git mode, which does not walk directories")
+            
+        # Collapsing is based on the directory aggregates
+        if self.collapse_threshold is not None:
+            if self.collapse_threshold <= 0:
+                raise ScannerConfigError("collapse_threshold must be positive if specified")
+            self.show_directory_aggregates = True
+            
+        # Resuming requires checkpoints to continue writing them
+        if self.checkpoint_interval is not None and self.checkpoint_interval <= 0:
+            raise ScannerConfigError("checkpoint_interval must be positive if specified")
+        if self.resume and self.checkpoint_interval is None:
+            self.checkpoint_interval = DEFAULT_CHECKPOINT_INTERVAL
+            
+        # Validate delta scan settings
+        if self.delta_manifest is not None:
+            self.delta_manifest = Path(self.delta_manifest)
+            if not self.delta_manifest.is_file():
+                raise ScannerConfigError(f"Previous scan manifest does not exist: {self.delta_manifest}")
+            if self.checkpoint_interval is not None:
+                raise ScannerConfigError("Delta scans cannot be combined with checkpoints")
+        if self.save_manifest is not None:
+            self.save_manifest = Path(self.save_manifest)
+            if not self.save_manifest.parent.exists():
+                raise ScannerConfigError(f"Manifest directory does not exist: {self.save_manifest.parent}")
+    
+    @property
+    def checkpoint_path(self) -> Path:
+        """Path of the checkpoint file kept next to the output file."""
+        return Path(str(self.output_file_path) + CHECKPOINT_SUFFIX)
+    
+    @property
+    def checkpoint_files_path(self) -> Path:
+        """Path of the file list belonging to the checkpoint."""
+        return Path(str(self.checkpoint_path) + CHECKPOINT_FILES_SUFFIX)
+    
+    def fingerprint(self) -> str:
+        """Hash of the settings that affect the report, used to validate checkpoints."""
+        settings = {}
+        for name in self.__dataclass_fields__:
+            if name in ("doc_support", "checkpoint_interval", "resume", "save_manifest", "walk_workers"):
+                continue
+            value = getattr(self, name)
+            if isinstance(value, set):
+                value = sorted(str(item) for item in value)
+            elif isinstance(value, Path):
+                value = str(value.absolute())
+            elif isinstance(value, Enum):
+                value = value.value
+            settings[name] = value
+        return hashlib.sha1(json.dumps(settings, sort_keys=True).encode('utf-8')).hexdigest()
 
 
 class ScannerError(Exception):
@@ -205,37 +618,364 @@ class ScannerError(Exception):
 class Scanner:
     """Scans project structure and generates reports."""
     
-    def __init__(self, config: ScannerConfig):
-        """Initialize the scanner with configuration."""
+    def __init__(self, config: ScannerConfig, document_cache: Optional[DocumentCache] = None,
+                 io_limiter: Optional[threading.Semaphore] = None):
+        """
+        Initialize the scanner with configuration.
+        
+        Args:
+            config: Scanner configuration
+            document_cache: Optional cache of extracted document text shared between scanners
+            io_limiter: Optional semaphore bounding concurrent file reads across scanners
+        """
         self.config = config
+        self.document_cache = document_cache
+        self.io_limiter = io_limiter
+        
+        # Blob object names and sizes when reading from a git revision
+        # Per-file side tables are keyed by relative POSIX path, not Path objects
+        self._git_blobs: Optional[Dict[str, Tuple[str, int]]] = None
+        self._git_cat_file: Optional[subprocess.Popen] = None
+        self._git_blob_cache: Optional[Tuple[Path, bytes]] = None
+        
+        # Virtual paths of archive members mapped to (archive path, member name, size)
+        self._archive_members: Dict[str, Tuple[str, str, int]] = {}
+        self._open_archives: 'OrderedDict[Path, Tuple[Any, Any]]' = OrderedDict()
+        
+        # Image and art source files collected for the asset summary
+        self._asset_files: List[str] = []
+        
+        # Parallel traversal: directory listings requested ahead of the walk
+        self._walk_pool: Optional[ThreadPoolExecutor] = None
+        self._prefetched_listings: Dict[Path, Future] = {}
     
     def scan(self) -> None:
-        """Perform the full project scan."""
+        """Perform the full project scan, resuming from a checkpoint if configured."""
+        checkpoint = self._load_checkpoint() if self.config.resume else None
+        
+        if self.config.walk_workers is not None and self.config.walk_workers > 1:
+            self._walk_pool = ThreadPoolExecutor(max_workers=self.config.walk_workers,
+                                                 thread_name_prefix="scanner-walk")
+        
         try:
-            with open(self.config.output_file_path, 'w', encoding='utf-8') as output_file:
-                self._write_header(output_file)
+            if self.config.delta_manifest is not None:
+                with open(self.config.output_file_path, 'w', encoding='utf-8') as output_file:
+                    self._scan_delta(output_file)
+                return
+            
+            if checkpoint is None:
+                output_file = open(self.config.output_file_path, 'w', encoding='utf-8')
+            else:
+                # Drop everything written after the last checkpoint
+                output_file = open(self.config.output_file_path, 'r+', encoding='utf-8')
+                output_file.seek(checkpoint["output_offset"])
+                output_file.truncate()
                 
-                # Collect files if showing structure
-                file_list = []
-                if self.config.show_structure:
-                    output_file.write("\nDIRECTORY STRUCTURE\n")
-                    output_file.write("-" * 18 + "\n\n")
-                    file_list = self._scan_directory(self.config.directory, output_file=output_file)
+            with output_file:
+                if checkpoint is None:
+                    self._write_header(output_file)
+                    
+                    # Collect files if showing structure
+                    file_list = FileCatalog()
+                    if self.config.show_structure:
+                        output_file.write("\nDIRECTORY STRUCTURE\n")
+                        output_file.write("-" * 18 + "\n\n")
+                        if self.config.git_mode:
+                            file_list = self._scan_git_files(output_file)
+                        elif self.config.show_directory_aggregates:
+                            total = DirectoryAggregate()
+                            file_list = self._scan_directory(self.config.directory, output_file=output_file,
+                                                             aggregate=total)
+                            output_file.write(f"\nTotal: {total.describe()}\n")
+                        else:
+                            file_list = self._scan_directory(self.config.directory, output_file=output_file)
+                    
+                    # Summarize asset headers if enabled
+                    if self.config.show_asset_summary:
+                        output_file.write("\nASSET SUMMARY\n")
+                        output_file.write("-" * 13 + "\n")
+                        self._write_asset_summary(output_file)
+                    
+                    if self.config.save_manifest is not None:
+                        self._save_manifest(self._build_manifest(file_list, {}))
+                    
+                    if self.config.show_contents:
+                        output_file.write("\nFILE CONTENTS\n")
+                        output_file.write("-" * 13 + "\n\n")
+                    files_done = 0
+                else:
+                    file_list = self._restore_checkpoint(checkpoint)
+                    files_done = checkpoint["files_done"]
                 
                 # Process file contents if enabled
                 if self.config.show_contents:
-                    output_file.write("\nFILE CONTENTS\n")
-                    output_file.write("-" * 13 + "\n\n")
-                    self._process_files(file_list, output_file)
+                    self._process_files(file_list, output_file, files_done)
                 else:
                     output_file.write("\nFile contents skipped\n")
                     
                 output_file.write(f"\n{'=' * 50}\n")
                 output_file.write(f"Scan completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            
+            self._remove_checkpoint()
         except PermissionError as e:
             raise ScannerError(f"Permission denied when writing to output file: {e}")
         except IOError as e:
             raise ScannerError(f"I/O error when writing to output file: {e}")
+        finally:
+            self._close_archives()
+            self._close_git_cat_file()
+            self._close_walk_pool()
+    
+    def _save_checkpoint(self, file_list: FileCatalog, files_done: int, output_file: TextIO) -> None:
+        """
+        Record the scan position so an interrupted scan can be resumed.
+        
+        The file list does not change after the walk, so it is written to a
+        separate file with the first checkpoint only.
+        
+        Args:
+            file_list: Files collected by the structure walk
+            files_done: Number of catalog entries whose contents have been written
+            output_file: Output file, flushed so the recorded offset is on disk
+        """
+        if files_done == 0:
+            directory = self.config.directory
+            self._write_json_atomically(self.config.checkpoint_files_path, {
+                "file_list": [str(path.relative_to(directory)) for path in file_list],
+                "archive_members": self._archive_members,
+            })
+        
+        output_file.flush()
+        self._write_json_atomically(self.config.checkpoint_path, {
+            "version": CHECKPOINT_VERSION,
+            "fingerprint": self.config.fingerprint(),
+            "output_offset": output_file.tell(),
+            "files_done": files_done,
+            "file_count": len(file_list),
+        })
+    
+    @staticmethod
+    def _write_json_atomically(path: Path, data: Dict[str, Any]) -> None:
+        """Write JSON through a temporary file so an interruption never leaves a broken file."""
+        temp_path = Path(str(path) + ".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as json_file:
+            json.dump(data, json_file)
+        os.replace(temp_path, path)
+    
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Load a checkpoint matching the current configuration, or None to start over."""
+        checkpoint_path = self.config.checkpoint_path
+        if not checkpoint_path.exists():
+            print(f"No checkpoint found at {checkpoint_path}, starting a full scan.")
+            return None
+        
+        try:
+            with open(checkpoint_path, 'r', encoding='utf-8') as checkpoint_file:
+                checkpoint = json.load(checkpoint_file)
+            with open(self.config.checkpoint_files_path, 'r', encoding='utf-8') as files_file:
+                checkpoint.update(json.load(files_file))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: Unable to read checkpoint {checkpoint_path}: {e}. Starting a full scan.")
+            return None
+        
+        if checkpoint.get("version") != CHECKPOINT_VERSION or checkpoint.get("fingerprint") != self.config.fingerprint():
+            print(f"Warning: Checkpoint {checkpoint_path} was made with different settings. Starting a full scan.")
+            return None
+        
+        output_path = self.config.output_file_path
+        if not output_path.exists() or output_path.stat().st_size < checkpoint["output_offset"]:
+            print(f"Warning: Output file does not match checkpoint {checkpoint_path}. Starting a full scan.")
+            return None
+        
+        print(f"Resuming scan after {checkpoint['files_done']} of {checkpoint['file_count']} files.")
+        return checkpoint
+    
+    def _restore_checkpoint(self, checkpoint: Dict[str, Any]) -> FileCatalog:
+        """Restore the file list and virtual file sources recorded in a checkpoint."""
+        directory = self.config.directory
+        self._archive_members = {
+            rel_path: (archive_key, member_name, size)
+            for rel_path, (archive_key, member_name, size) in checkpoint["archive_members"].items()
+        }
+        
+        # Blob names for revision scans come from one cheap tree listing
+        if self.config.git_revision:
+            self._list_git_files()
+        
+        file_list = FileCatalog()
+        for path in checkpoint["file_list"]:
+            file_list.add(directory / path)
+        return file_list
+    
+    def _remove_checkpoint(self) -> None:
+        """Delete the checkpoint once the report is complete."""
+        if self.config.checkpoint_interval is not None:
+            for path in (self.config.checkpoint_path, self.config.checkpoint_files_path):
+                if path.exists():
+                    path.unlink()
+    
+    def _collect_files(self) -> FileCatalog:
+        """Collect the file list without writing the directory structure."""
+        if self.config.git_mode:
+            return self._scan_git_files(_NullOutput())
+        return self._scan_directory(self.config.directory, output_file=_NullOutput())
+    
+    def _build_manifest(self, file_list: FileCatalog, previous: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Record size, modification time, hash and text content of the scanned files.
+        
+        Files whose size and modification time match the previous manifest are
+        carried over without reading their content.
+        
+        Args:
+            file_list: Files collected by the structure walk
+            previous: File entries of the previous manifest (may be empty)
+            
+        Returns:
+            Manifest dictionary ready to be saved as JSON
+        """
+        skipped = self._generated_file_indices(file_list)
+        max_bytes = self.config.max_file_size_kb * 1024 if self.config.max_file_size_kb is not None else None
+        files = {}
+        
+        for index in range(len(file_list)):
+            file_path = file_list[index]
+            if index in skipped or not self._should_process_file(file_path):
+                continue
+            rel_path = file_path.relative_to(self.config.directory).as_posix()
+            
+            try:
+                # Only working tree files have a meaningful modification time
+                mtime_ns = None
+                if self._is_working_tree_file(file_path):
+                    size, mtime_ns = file_list.stat(index)
+                else:
+                    size = self._get_file_size(file_path)
+                
+                old_entry = previous.get(rel_path)
+                if (mtime_ns is not None and old_entry is not None
+                        and old_entry["size"] == size and old_entry["mtime_ns"] == mtime_ns):
+                    files[rel_path] = old_entry
+                    continue
+                
+                # Hash in chunks; only text within the size limit is kept so later scans can diff against it
+                sha1 = hashlib.sha1()
+                text_chunks = None
+                with self._open_source(file_path, binary=True) as file:
+                    chunk = file.read(4096)
+                    if (max_bytes is None or size <= max_bytes) and not self._is_binary_chunk(chunk):
+                        text_chunks = []
+                    while chunk:
+                        sha1.update(chunk)
+                        if text_chunks is not None:
+                            text_chunks.append(chunk)
+                        chunk = file.read(MANIFEST_HASH_CHUNK_SIZE)
+            except OSError as e:
+                print(f"Warning: Error reading file {file_path}: {e}")
+                continue
+            
+            files[rel_path] = {
+                "size": size,
+                "mtime_ns": mtime_ns,
+                "sha1": sha1.hexdigest(),
+                "text": b''.join(text_chunks).decode('utf-8', errors='replace') if text_chunks is not None else None,
+            }
+        
+        return {
+            "version": MANIFEST_VERSION,
+            "directory": str(self.config.directory.absolute()),
+            "created": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "files": files,
+        }
+    
+    def _generated_file_indices(self, file_list: FileCatalog) -> Set[Optional[int]]:
+        """Catalog indices of the output file and scan manifests, which must not be scanned themselves."""
+        paths = (self.config.output_file_path, self.config.save_manifest, self.config.delta_manifest)
+        return {file_list.index_of(path) for path in paths if path is not None}
+    
+    def _save_manifest(self, manifest: Dict[str, Any]) -> None:
+        """Write a scan manifest atomically."""
+        self._write_json_atomically(self.config.save_manifest, manifest)
+    
+    def _load_manifest(self, manifest_path: Path) -> Dict[str, Any]:
+        """Load a scan manifest written by an earlier scan."""
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, json.JSONDecodeError) as e:
+            raise ScannerError(f"Unable to read scan manifest {manifest_path}: {e}")
+        
+        if manifest.get("version") != MANIFEST_VERSION or not isinstance(manifest.get("files"), dict):
+            raise ScannerError(f"Unsupported scan manifest format: {manifest_path}")
+        return manifest
+    
+    def _scan_delta(self, output_file: TextIO) -> None:
+        """
+        Write a report of the files added, removed or modified since a previous scan.
+        
+        Args:
+            output_file: File to write output to
+        """
+        previous = self._load_manifest(self.config.delta_manifest)
+        file_list = self._collect_files()
+        current = self._build_manifest(file_list, previous["files"])
+        
+        old_files, new_files = previous["files"], current["files"]
+        added = sorted(set(new_files) - set(old_files))
+        removed = sorted(set(old_files) - set(new_files))
+        modified = sorted(path for path in set(new_files) & set(old_files)
+                          if new_files[path]["sha1"] != old_files[path]["sha1"])
+        
+        self._write_header(output_file)
+        output_file.write(f"\nCompared with: {self.config.delta_manifest} (scan from {previous.get('created', 'unknown')})\n")
+        output_file.write(f"Added: {len(added)}, Removed: {len(removed)}, Modified: {len(modified)}, "
+                          f"Unchanged: {len(new_files) - len(added) - len(modified)}\n")
+        
+        output_file.write("\nCHANGED FILES\n")
+        output_file.write("-" * 13 + "\n\n")
+        for marker, paths in (("+", added), ("-", removed), ("~", modified)):
+            for rel_path in paths:
+                output_file.write(f"{marker} {rel_path}\n")
+        
+        # Show contents of added files and diffs of modified ones
+        if self.config.show_contents:
+            output_file.write("\nADDED FILE CONTENTS\n")
+            output_file.write("-" * 19 + "\n\n")
+            for rel_path in added:
+                self._process_file(self.config.directory / rel_path, output_file)
+            
+            output_file.write("\nMODIFIED FILE DIFFS\n")
+            output_file.write("-" * 19 + "\n\n")
+            for rel_path in modified:
+                self._write_file_diff(rel_path, old_files[rel_path], new_files[rel_path], output_file)
+        
+        output_file.write(f"\n{'=' * 50}\n")
+        output_file.write(f"Scan completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        
+        if self.config.save_manifest is not None:
+            self._save_manifest(current)
+    
+    def _write_file_diff(self, rel_path: str, old_entry: Dict[str, Any], new_entry: Dict[str, Any],
+                         output_file: TextIO) -> None:
+        """Write a unified diff between the previous and current text of a file."""
+        output_file.write(f"\n{'=' * 40}\n")
+        output_file.write(f"Diff of {self.config.directory / rel_path}:\n")
+        output_file.write(f"{'=' * 40}\n")
+        
+        if old_entry["text"] is None or new_entry["text"] is None:
+            output_file.write(f"  [Binary or oversized file changed: {old_entry['size']} -> {new_entry['size']} bytes]\n")
+            return
+        
+        diff = difflib.unified_diff(
+            old_entry["text"].splitlines(), new_entry["text"].splitlines(),
+            fromfile=f"a/{rel_path}", tofile=f"b/{rel_path}", lineterm=""
+        )
+        max_lines = self.config.max_line_count
+        for i, line in enumerate(diff):
+            if max_lines is not None and i >= max_lines:
+                output_file.write(f"... (diff truncated after {max_lines} lines) ...\n")
+                break
+            output_file.write(f"  {line}\n")
     
     def _write_header(self, output_file: TextIO) -> None:
         """Write the scan report header."""
@@ -261,11 +1001,26 @@ class Scanner:
         if self.config.blacklisted_paths:
             output_file.write(f"Blacklisted paths: {', '.join(str(p) for p in self.config.blacklisted_paths)}\n")
             
+        if self.config.outline_extensions:
+            output_file.write(f"Outlined file types: {', '.join(sorted(self.config.outline_extensions))}\n")
+            
+        if self.config.scan_archives:
+            output_file.write(f"Archives: scanned as virtual directories\n")
+            
+        if self.config.show_asset_summary:
+            output_file.write(f"Asset summary: {', '.join(sorted(ASSET_METADATA_EXTENSIONS))}\n")
+            
+        if self.config.git_mode:
+            output_file.write(f"Git mode: tracked files"
+                              f"{f', changed since {self.config.git_since}' if self.config.git_since else ''}"
+                              f"{f', at revision {self.config.git_revision}' if self.config.git_revision else ''}\n")
+            
         output_file.write(f"\n{self.config.doc_support.get_status_report()}\n")
         output_file.write(f"{'=' * 50}")
     
     def _scan_directory(self, directory: Path, indent: str = "", output_file: TextIO = None, 
-                       file_list: Optional[List[Path]] = None) -> List[Path]:
+                       file_list: Optional[FileCatalog] = None,
+                       aggregate: Optional[DirectoryAggregate] = None) -> FileCatalog:
         """
         Recursively scan a directory and collect files.
         
@@ -273,64 +1028,493 @@ class Scanner:
             directory: The directory to scan
             indent: Current indentation level for output formatting
             output_file: File to write output to
-            file_list: List to collect file paths
+            file_list: Catalog to collect file paths
+            aggregate: Totals of this directory to fill in when directory aggregates are enabled
             
         Returns:
-            List of file paths found during scanning
+            Catalog of file paths found during scanning
         """
         if file_list is None:
-            file_list = []
+            file_list = FileCatalog()
             
         # Skip if this directory is blacklisted
-        if directory.absolute() in self.config.blacklisted_paths:
+        blacklist = self.config.blacklisted_paths
+        if blacklist and directory.absolute() in blacklist:
             output_file.write(f"{indent}[DIR] {directory.name} (blacklisted)\n")
             return file_list
             
         try:
-            items = sorted(os.listdir(directory))
+            entries = self._list_directory(directory, with_stat=aggregate is not None)
             
-            for item in items:
+            for item, is_dir, stat in entries:
                 item_path = directory / item
                 
                 # Skip if this path is blacklisted
-                if item_path.absolute() in self.config.blacklisted_paths:
-                    output_file.write(f"{indent}{'- ' if item_path.is_file() else '[DIR] '}{item} (blacklisted)\n")
+                if blacklist and item_path.absolute() in blacklist:
+                    output_file.write(f"{indent}{'[DIR] ' if is_dir else '- '}{item} (blacklisted)\n")
                     continue
                 
-                if item_path.is_dir():
+                if is_dir:
                     # Skip excluded directories
-                    if item in self.config.excluded_dirs or item.startswith('.'):
+                    if self._is_excluded_dir(item):
                         output_file.write(f"{indent}[DIR] {item} (excluded)\n")
                         continue
                         
-                    output_file.write(f"{indent}[DIR] {item}\n")
-                    self._scan_directory(item_path, indent + "  ", output_file, file_list)
+                    if aggregate is not None:
+                        self._scan_aggregated_directory(item_path, indent, output_file, file_list, aggregate)
+                    else:
+                        output_file.write(f"{indent}[DIR] {item}\n")
+                        self._scan_directory(item_path, indent + "  ", output_file, file_list)
+                else:
+                    if aggregate is not None:
+                        aggregate.add_file(item_path.suffix.lower(), stat.st_size if stat is not None else 0)
+                        
+                        # Stop listing files once the directory is known to be collapsed
+                        threshold = self.config.collapse_threshold
+                        if threshold is not None and aggregate.direct_files > threshold and indent:
+                            aggregate.collapsed = True
+                            output_file = _NullOutput()
+                    
+                    self._add_file_entry(item_path, indent, output_file, file_list, stat, directory)
+                    
+        except PermissionError:
+            output_file.write(f"{indent}[Permission Denied]\n")
+        except OSError as e:
+            output_file.write(f"{indent}[Error: {str(e)}]\n")
+            
+        return file_list
+    
+    def _is_excluded_dir(self, name: str) -> bool:
+        """Check if a directory name is excluded from the walk."""
+        return name in self.config.excluded_dirs or name.startswith('.')
+    
+    @staticmethod
+    def _read_directory(directory: Path, with_stat: bool = False) -> List[Tuple[str, bool, Optional[os.stat_result]]]:
+        """
+        List a directory sorted by name.
+        
+        Directory flags come from the scandir entry types, so no stat call is
+        needed per entry unless file status is requested.
+        
+        Args:
+            directory: Directory to list
+            with_stat: Also read the status of files (None if it cannot be read)
+            
+        Returns:
+            List of (name, is_dir, file status) tuples
+        """
+        entries = []
+        with os.scandir(directory) as scan:
+            for entry in scan:
+                is_dir = entry.is_dir()
+                stat = None
+                if with_stat and not is_dir:
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        pass
+                entries.append((entry.name, is_dir, stat))
+        entries.sort(key=lambda item: item[0])
+        return entries
+    
+    def _list_directory(self, directory: Path, with_stat: bool = False) -> List[Tuple[str, bool, Optional[os.stat_result]]]:
+        """
+        List a directory for the walk, using walker threads when parallel traversal is enabled.
+        
+        In parallel mode the listings of all subdirectories that will be
+        walked are requested as soon as their parent is listed, so sibling
+        subtrees are read concurrently while the walk still consumes them in
+        sorted order.
+        """
+        if self._walk_pool is None:
+            return self._read_directory(directory, with_stat)
+        
+        future = self._prefetched_listings.pop(directory, None)
+        if future is None:
+            future = self._walk_pool.submit(self._read_directory, directory, with_stat)
+        entries = future.result()
+        
+        # Fan out to the subdirectories the walk will descend into
+        blacklist = self.config.blacklisted_paths
+        for name, is_dir, _ in entries:
+            if not is_dir or self._is_excluded_dir(name):
+                continue
+            subdirectory = directory / name
+            if blacklist and subdirectory.absolute() in blacklist:
+                continue
+            self._prefetched_listings[subdirectory] = self._walk_pool.submit(
+                self._read_directory, subdirectory, with_stat
+            )
+        return entries
+    
+    def _close_walk_pool(self) -> None:
+        """Stop the walker threads, dropping listings that were not used."""
+        if self._walk_pool is not None:
+            self._walk_pool.shutdown(wait=True, cancel_futures=True)
+            self._walk_pool = None
+            self._prefetched_listings.clear()
+    
+    def _scan_aggregated_directory(self, directory: Path, indent: str, output_file: TextIO,
+                                   file_list: FileCatalog, parent_aggregate: DirectoryAggregate) -> None:
+        """
+        Scan a subdirectory into a buffer so its header line can show the subtree totals.
+        
+        Each level buffers only its own subtree and spills to disk beyond
+        AGGREGATE_BUFFER_SIZE, so memory stays bounded by the tree depth.
+        Collapsed directories are written as a single summary line.
+        
+        Args:
+            directory: The subdirectory to scan
+            indent: Indentation of the subdirectory's header line
+            output_file: File to write output to
+            file_list: Catalog to collect file paths
+            parent_aggregate: Totals of the parent directory to add this subtree to
+        """
+        aggregate = DirectoryAggregate()
+        with tempfile.SpooledTemporaryFile(max_size=AGGREGATE_BUFFER_SIZE, mode='w+', encoding='utf-8') as buffer:
+            self._scan_directory(directory, indent + "  ", buffer, file_list, aggregate)
+            
+            if aggregate.collapsed:
+                output_file.write(f"{indent}[DIR] {directory.name} (collapsed: {aggregate.describe()})\n")
+            else:
+                output_file.write(f"{indent}[DIR] {directory.name} ({aggregate.describe()})\n")
+                buffer.seek(0)
+                shutil.copyfileobj(buffer, output_file)
+        
+        parent_aggregate.merge(aggregate)
+    
+    def _add_file_entry(self, item_path: Path, indent: str, output_file: TextIO, 
+                        file_list: FileCatalog, stat: Optional[os.stat_result] = None,
+                        directory: Optional[Path] = None) -> None:
+        """
+        Write a file entry to the structure and collect it if it passes the extension filter.
+        
+        Args:
+            item_path: Path of the file
+            indent: Current indentation level for output formatting
+            output_file: File to write output to
+            file_list: Catalog to collect file paths
+            stat: File status if the walk already read it
+            directory: Parent directory object shared by sibling entries
+        """
+        item = item_path.name
+        
+        # Expand archives into virtual directories (members are never expanded again)
+        if (self.config.scan_archives and self._get_archive_kind(item_path)
+                and self._archive_member(item_path) is None):
+            self._scan_archive(item_path, indent, output_file, file_list)
+            return
+        
+        # Check file extension based on filter mode
+        extension = item_path.suffix.lower()
+        skip_file = False
+        
+        # Collect assets for the summary regardless of the content filter
+        if self.config.show_asset_summary and extension in ASSET_METADATA_EXTENSIONS:
+            self._asset_files.append(self._relative_key(item_path))
+        
+        if self.config.filter_mode == FilterMode.EXCLUDE:
+            # Skip files with excluded extensions
+            if extension in self.config.excluded_extensions:
+                output_file.write(f"{indent}- {item} (excluded by extension)\n")
+                skip_file = True
+        else:  # INCLUDE mode
+            # Skip files without included extensions
+            if extension not in self.config.included_extensions:
+                #output_file.write(f"{indent}- {item} (not in included extensions)\n")
+                skip_file = True
+        
+        if not skip_file:
+            output_file.write(f"{indent}- {item}\n")
+            size, mtime_ns = (stat.st_size, stat.st_mtime_ns) if stat is not None else (FileCatalog.UNKNOWN,) * 2
+            file_list.add_entry(directory or item_path.parent, item, size, mtime_ns)
+    
+    def _run_git(self, *args: str) -> bytes:
+        """Run a git command in the scanned directory and return its output."""
+        try:
+            result = subprocess.run(
+                ["git", "-C", str(self.config.directory), *args],
+                capture_output=True, check=False
+            )
+        except FileNotFoundError:
+            raise ScannerError("Git mode requires the git executable on PATH")
+        
+        if result.returncode != 0:
+            stderr = result.stderr.decode('utf-8', errors='replace').strip()
+            raise ScannerError(f"git {args[0]} failed: {stderr}")
+        return result.stdout
+    
+    def _list_git_files(self) -> List[str]:
+        """
+        List tracked files relative to the scanned directory.
+        
+        Uses the index (or the given revision's tree) so no directory walk is needed.
+        When a since-ref is configured only added or modified files are returned.
+        
+        Returns:
+            Sorted list of relative POSIX paths
+        """
+        revision = self.config.git_revision
+        
+        if revision:
+            # Tree listing with object names and sizes: "<mode> <type> <sha> <size>\t<path>"
+            self._git_blobs = {}
+            for entry in self._run_git("ls-tree", "-r", "-l", "-z", revision).split(b'\0'):
+                if not entry:
+                    continue
+                info, _, rel_path = entry.partition(b'\t')
+                _, obj_type, obj_name, size = info.split()
+                if obj_type != b'blob':
+                    continue
+                self._git_blobs[os.fsdecode(rel_path)] = (obj_name.decode('ascii'), int(size))
+            rel_paths = list(self._git_blobs)
+        else:
+            rel_paths = [os.fsdecode(p) for p in self._run_git("ls-files", "-z").split(b'\0') if p]
+        
+        if self.config.git_since:
+            diff_args = ["diff", "--name-only", "--relative", "--diff-filter=ACMRT", "-z", self.config.git_since]
+            if revision:
+                diff_args.append(revision)
+            changed = {os.fsdecode(p) for p in self._run_git(*diff_args).split(b'\0') if p}
+            rel_paths = [p for p in rel_paths if p in changed]
+        
+        return sorted(set(rel_paths))
+    
+    def _scan_git_files(self, output_file: TextIO) -> FileCatalog:
+        """
+        Build the directory structure from the git file list instead of walking the tree.
+        
+        Args:
+            output_file: File to write output to
+            
+        Returns:
+            Catalog of file paths found
+        """
+        tree = self._build_file_tree(self._list_git_files())
+        
+        file_list = FileCatalog()
+        self._write_file_tree(tree, self.config.directory, "", output_file, file_list)
+        return file_list
+    
+    @staticmethod
+    def _build_file_tree(rel_paths) -> Dict[str, Any]:
+        """Build a nested dict tree (directory name -> subtree, file name -> None) from POSIX paths."""
+        tree: Dict[str, Any] = {}
+        for rel_path in rel_paths:
+            *dirs, name = rel_path.split('/')
+            node = tree
+            for part in dirs:
+                node = node.setdefault(part, {})
+            node[name] = None
+        return tree
+    
+    def _write_file_tree(self, tree: Dict[str, Any], directory: Path, indent: str, 
+                        output_file: TextIO, file_list: FileCatalog) -> None:
+        """Write a file tree from git or an archive in the same format as _scan_directory."""
+        for item in sorted(tree):
+            item_path = directory / item
+            subtree = tree[item]
+            
+            # Skip if this path is blacklisted
+            if item_path.absolute() in self.config.blacklisted_paths:
+                output_file.write(f"{indent}{'[DIR] ' if subtree is not None else '- '}{item} (blacklisted)\n")
+                continue
+            
+            if subtree is not None:
+                # Skip excluded directories
+                if item in self.config.excluded_dirs or item.startswith('.'):
+                    output_file.write(f"{indent}[DIR] {item} (excluded)\n")
+                    continue
+                
+                output_file.write(f"{indent}[DIR] {item}\n")
+                self._write_file_tree(subtree, item_path, indent + "  ", output_file, file_list)
+            else:
+                self._add_file_entry(item_path, indent, output_file, file_list, directory=directory)
+    
+    @staticmethod
+    def _get_archive_kind(file_path: Path) -> Optional[str]:
+        """Return 'zip' or 'tar' if the file name marks a supported archive, otherwise None."""
+        name = file_path.name.lower()
+        if name.endswith(ZIP_ARCHIVE_SUFFIXES):
+            return 'zip'
+        if name.endswith(TAR_ARCHIVE_SUFFIXES):
+            return 'tar'
+        return None
+    
+    def _open_archive(self, archive_path: Path) -> Tuple[Any, Any]:
+        """Open an archive for reading and return it together with its underlying source."""
+        source = self._open_source(archive_path, binary=True)
+        try:
+            if self._get_archive_kind(archive_path) == 'zip':
+                archive = zipfile.ZipFile(source)
+            else:
+                archive = tarfile.open(fileobj=source, mode='r:*')
+        except Exception:
+            source.close()
+            raise
+        return archive, source
+    
+    def _get_archive(self, archive_path: Path):
+        """Return an open archive for member reads, keeping only the most recently used ones open."""
+        if archive_path in self._open_archives:
+            self._open_archives.move_to_end(archive_path)
+            return self._open_archives[archive_path][0]
+        
+        archive, source = self._open_archive(archive_path)
+        self._open_archives[archive_path] = (archive, source)
+        
+        # Members are read to the end before the next file is opened, so evicting is safe
+        while len(self._open_archives) > MAX_OPEN_ARCHIVES:
+            _, (old_archive, old_source) = self._open_archives.popitem(last=False)
+            old_archive.close()
+            old_source.close()
+        return archive
+    
+    def _close_archives(self) -> None:
+        """Close the archives still open for member reads."""
+        for archive, source in self._open_archives.values():
+            archive.close()
+            source.close()
+        self._open_archives.clear()
+    
+    def _scan_archive(self, archive_path: Path, indent: str, output_file: TextIO, 
+                      file_list: FileCatalog) -> None:
+        """
+        List an archive's members as a virtual directory without extracting anything.
+        
+        Args:
+            archive_path: Path of the archive
+            indent: Current indentation level for output formatting
+            output_file: File to write output to
+            file_list: Catalog to collect member paths
+        """
+        # Close the archive after listing; member reads reopen it on demand
+        try:
+            archive, source = self._open_archive(archive_path)
+            try:
+                if isinstance(archive, zipfile.ZipFile):
+                    members = [(info.filename, info.file_size) for info in archive.infolist() if not info.is_dir()]
                 else:
-                    # Check file extension based on filter mode
-                    extension = item_path.suffix.lower()
-                    skip_file = False
-                    
-                    if self.config.filter_mode == FilterMode.EXCLUDE:
-                        # Skip files with excluded extensions
-                        if extension in self.config.excluded_extensions:
-                            output_file.write(f"{indent}- {item} (excluded by extension)\n")
-                            skip_file = True
-                    else:  # INCLUDE mode
-                        # Skip files without included extensions
-                        if extension not in self.config.included_extensions:
-                            #output_file.write(f"{indent}- {item} (not in included extensions)\n")
-                            skip_file = True
-                    
-                    if not skip_file:
-                        output_file.write(f"{indent}- {item}\n")
-                        file_list.append(item_path)
-                    
-        except PermissionError:
-            output_file.write(f"{indent}[Permission Denied]\n")
-        except OSError as e:
-            output_file.write(f"{indent}[Error: {str(e)}]\n")
-            
-        return file_list
+                    members = [(info.name, info.size) for info in archive.getmembers() if info.isfile()]
+            finally:
+                archive.close()
+                source.close()
+        except (zipfile.BadZipFile, tarfile.TarError, OSError) as e:
+            output_file.write(f"{indent}[ARCHIVE] {archive_path.name} [Error: {e}]\n")
+            return
+        
+        # Register members under virtual paths inside the archive
+        archive_key = self._relative_key(archive_path)
+        rel_paths = []
+        for member_name, size in members:
+            rel_path = member_name.replace('\\', '/').lstrip('/')
+            while rel_path.startswith('./'):
+                rel_path = rel_path[2:]
+            if not rel_path:
+                continue
+            self._archive_members[f"{archive_key}/{rel_path}"] = (archive_key, member_name, size)
+            rel_paths.append(rel_path)
+        
+        output_file.write(f"{indent}[ARCHIVE] {archive_path.name} ({len(rel_paths)} files)\n")
+        self._write_file_tree(self._build_file_tree(rel_paths), archive_path, indent + "  ", output_file, file_list)
+    
+    def _relative_key(self, file_path: Path) -> str:
+        """Relative POSIX path of a file, used as key of the per-file side tables."""
+        return file_path.relative_to(self.config.directory).as_posix()
+    
+    def _archive_member(self, file_path: Path) -> Optional[Tuple[str, str, int]]:
+        """(Archive key, member name, size) of a virtual archive member path, or None for other files."""
+        if not self._archive_members:
+            return None
+        return self._archive_members.get(self._relative_key(file_path))
+    
+    def _is_working_tree_file(self, file_path: Path) -> bool:
+        """Whether a file is read from the working tree, so its catalog size and mtime apply."""
+        return self._git_blobs is None and self._archive_member(file_path) is None
+    
+    def _open_archive_member(self, member: Tuple[str, str, int]):
+        """Open an archive member as a binary stream, decompressing on the fly."""
+        archive_key, member_name, _ = member
+        archive = self._get_archive(self.config.directory / archive_key)
+        if isinstance(archive, zipfile.ZipFile):
+            return archive.open(member_name)
+        return archive.extractfile(member_name)
+    
+    def _read_git_blob(self, file_path: Path) -> bytes:
+        """Read a file's content from the git object store at the configured revision."""
+        if self._git_blob_cache is not None and self._git_blob_cache[0] == file_path:
+            return self._git_blob_cache[1]
+        
+        blob = self._git_blobs.get(self._relative_key(file_path))
+        if blob is None:
+            raise FileNotFoundError(file_path)
+        obj_name, _ = blob
+        
+        # Keep a single batch process open for all blob reads
+        if self._git_cat_file is None:
+            self._git_cat_file = subprocess.Popen(
+                ["git", "-C", str(self.config.directory), "cat-file", "--batch"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE
+            )
+        
+        self._git_cat_file.stdin.write(obj_name.encode('ascii') + b'\n')
+        self._git_cat_file.stdin.flush()
+        header = self._git_cat_file.stdout.readline().split()
+        if len(header) < 3 or header[1] != b'blob':
+            raise ScannerError(f"Unable to read {file_path} from git revision {self.config.git_revision}")
+        data = self._git_cat_file.stdout.read(int(header[2]))
+        self._git_cat_file.stdout.read(1)  # Trailing newline
+        
+        self._git_blob_cache = (file_path, data)
+        return data
+    
+    def _close_git_cat_file(self) -> None:
+        """Shut down the git batch process if one was started."""
+        if self._git_cat_file is not None:
+            self._git_cat_file.stdin.close()
+            self._git_cat_file.wait()
+            self._git_cat_file = None
+    
+    def _open_source(self, file_path: Path, binary: bool = False):
+        """Open a file from the working tree, an archive or, in revision mode, the git object store."""
+        member = self._archive_member(file_path)
+        if member is not None:
+            stream = self._open_archive_member(member)
+            if binary:
+                return stream
+            return io.TextIOWrapper(stream, encoding='utf-8', errors='replace')
+        
+        if self._git_blobs is None:
+            if binary:
+                return open(file_path, 'rb')
+            return open(file_path, 'r', encoding='utf-8', errors='replace')
+        
+        data = self._read_git_blob(file_path)
+        if binary:
+            return io.BytesIO(data)
+        return io.StringIO(data.decode('utf-8', errors='replace'), newline=None)
+    
+    def _document_source(self, file_path: Path):
+        """Get a path or in-memory stream suitable for the document libraries."""
+        member = self._archive_member(file_path)
+        if member is not None:
+            with self._open_archive_member(member) as stream:
+                return io.BytesIO(stream.read())
+        if self._git_blobs is None:
+            return file_path
+        return io.BytesIO(self._read_git_blob(file_path))
+    
+    def _get_file_size(self, file_path: Path) -> int:
+        """Get a file's size in bytes from the working tree, an archive listing or the git revision."""
+        member = self._archive_member(file_path)
+        if member is not None:
+            return member[2]
+        if self._git_blobs is None:
+            return file_path.stat().st_size
+        blob = self._git_blobs.get(self._relative_key(file_path))
+        if blob is None:
+            raise FileNotFoundError(file_path)
+        return blob[1]
     
     def _should_process_file(self, file_path: Path) -> bool:
         """
@@ -359,54 +1543,233 @@ class Scanner:
             # Process only files with included extensions
             return extension in self.config.included_extensions
     
-    def _process_files(self, file_list: List[Path], output_file: TextIO) -> None:
+    def _process_files(self, file_list: FileCatalog, output_file: TextIO, files_done: int = 0) -> None:
         """
         Process and display file contents.
         
         Args:
-            file_list: List of files to process
+            file_list: Catalog of files to process
             output_file: File to write output to
+            files_done: Number of catalog entries already processed by a resumed scan
         """
-        # Filter out special files and the output file itself
-        script_path = Path(__file__).absolute()
-        output_path = self.config.output_file_path.absolute()
+        # Filter out special files and the files written by the scan itself
+        skipped = self._generated_file_indices(file_list)
+        skipped.add(file_list.index_of(Path(__file__)))
         
-        filtered_files = [
-            f for f in file_list 
-            if f.absolute() != output_path and f.absolute() != script_path
-        ]
+        interval = self.config.checkpoint_interval
+        if interval is not None and files_done == 0:
+            self._save_checkpoint(file_list, 0, output_file)
         
         # Process each file
-        for file_path in filtered_files:
-            try:
-                # Apply filter based on mode and extensions
-                if not self._should_process_file(file_path):
-                    continue
+        for index in range(files_done, len(file_list)):
+            if index not in skipped:
+                with self.io_limiter or nullcontext():
+                    self._process_file(file_list[index], output_file, file_list, index)
+            
+            if interval is not None and (index + 1) % interval == 0:
+                self._save_checkpoint(file_list, index + 1, output_file)
+    
+    def _process_file(self, file_path: Path, output_file: TextIO,
+                      file_list: Optional[FileCatalog] = None, index: Optional[int] = None) -> None:
+        """
+        Process and display a single file, reporting errors in the output.
+        
+        Args:
+            file_path: File to process
+            output_file: File to write output to
+            file_list: Catalog holding the file, whose recorded size is used for working tree files
+            index: Index of the file in the catalog
+        """
+        try:
+            # Apply filter based on mode and extensions
+            if not self._should_process_file(file_path):
+                return
+            
+            # Check file size if max size is specified
+            if self.config.max_file_size_kb is not None:
+                if file_list is not None and self._is_working_tree_file(file_path):
+                    file_size_kb = file_list.stat(index)[0] / 1024
+                else:
+                    file_size_kb = self._get_file_size(file_path) / 1024
+                if file_size_kb > self.config.max_file_size_kb:
+                    output_file.write(
+                        f"\n[Skipped {file_path}: Size {file_size_kb:.1f}KB exceeds limit of "
+                        f"{self.config.max_file_size_kb}KB]\n"
+                    )
+                    return
+            
+            # Process the file based on its type
+            if file_path.suffix.lower() in self.config.outline_extensions:
+                self._process_outline_file(file_path, output_file)
+            elif self._is_document_file(file_path):
+                self._process_document(file_path, output_file)
+            elif not self._is_binary_file(file_path):
+                self._process_text_file(file_path, output_file)
                 
-                # Check file size if max size is specified
-                if self.config.max_file_size_kb is not None:
-                    file_size_kb = file_path.stat().st_size / 1024
-                    if file_size_kb > self.config.max_file_size_kb:
-                        output_file.write(
-                            f"\n[Skipped {file_path}: Size {file_size_kb:.1f}KB exceeds limit of "
-                            f"{self.config.max_file_size_kb}KB]\n"
-                        )
-                        continue
+        except FileNotFoundError:
+            output_file.write(f"\n[Error: File not found: {file_path}]\n")
+        except PermissionError:
+            output_file.write(f"\n[Error: Permission denied: {file_path}]\n")
+        except UnicodeDecodeError:
+            output_file.write(f"\n[Error: Unable to decode file {file_path} - not a valid text file]\n")
+        except Exception as e:
+            output_file.write(f"\n[Error processing file {file_path}: {e}]\n")
+    
+    def _write_asset_summary(self, output_file: TextIO) -> None:
+        """
+        Write a per-directory table of asset dimensions and formats.
+        
+        Only the file headers are read; no pixel data is decoded.
+        
+        Args:
+            output_file: File to write output to
+        """
+        # Group assets by directory, keeping walk order
+        by_directory: Dict[str, List[str]] = {}
+        for rel_path in self._asset_files:
+            by_directory.setdefault(rel_path.rpartition('/')[0] or '.', []).append(rel_path)
+        
+        for label, assets in by_directory.items():
+            output_file.write(f"\n[{label}] ({len(assets)} asset{'s' if len(assets) != 1 else ''})\n")
+            
+            rows = []
+            for rel_path in assets:
+                file_path = self.config.directory / rel_path
+                try:
+                    metadata = self._read_asset_metadata(file_path)
+                except Exception as e:
+                    metadata = None
+                    error = str(e) or type(e).__name__
+                else:
+                    error = "unrecognized header"
                 
-                # Process the file based on its type
-                if self._is_document_file(file_path):
-                    self._process_document(file_path, output_file)
-                elif not self._is_binary_file(file_path):
-                    self._process_text_file(file_path, output_file)
-                    
-            except FileNotFoundError:
-                output_file.write(f"\n[Error: File not found: {file_path}]\n")
-            except PermissionError:
-                output_file.write(f"\n[Error: Permission denied: {file_path}]\n")
-            except UnicodeDecodeError:
-                output_file.write(f"\n[Error: Unable to decode file {file_path} - not a valid text file]\n")
-            except Exception as e:
-                output_file.write(f"\n[Error processing file {file_path}: {e}]\n")
+                if metadata is None:
+                    rows.append((file_path.name, file_path.suffix.upper()[1:], "?", f"[{error}]"))
+                else:
+                    kind, width, height, details = metadata
+                    rows.append((file_path.name, kind, f"{width}x{height}", details))
+            
+            name_width = max(len(row[0]) for row in rows)
+            size_width = max(len(row[2]) for row in rows)
+            for name, kind, size, details in rows:
+                output_file.write(f"  {name:<{name_width}}  {kind:<8} {size:>{size_width}}  {details}\n")
+    
+    def _read_asset_metadata(self, file_path: Path) -> Optional[Tuple[str, int, int, str]]:
+        """
+        Read image metadata from the header of an asset file.
+        
+        Args:
+            file_path: Path to the asset
+            
+        Returns:
+            Tuple of (format, width, height, details) or None if the header is not recognized
+        """
+        with self._open_source(file_path, binary=True) as file:
+            header = file.read(30)
+            
+            if header.startswith(b'\x89PNG\r\n\x1a\n') and header[12:16] == b'IHDR':
+                width, height, bit_depth, color_type = struct.unpack('>IIBB', header[16:26])
+                interlaced = ", interlaced" if header[28:29] == b'\x01' else ""
+                return ("PNG", width, height,
+                        f"{PNG_COLOR_TYPES.get(color_type, f'type {color_type}')}, {bit_depth}-bit{interlaced}")
+            
+            if header[:6] in (b'GIF87a', b'GIF89a'):
+                return self._read_gif_metadata(file, header)
+            
+            if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+                return self._read_webp_metadata(file, header)
+            
+            if header[:4] == b'8BPS':
+                return self._read_psd_metadata(file, header)
+            
+            if len(header) >= 14 and struct.unpack('<H', header[4:6])[0] == 0xA5E0:
+                frames, width, height, depth = struct.unpack('<HHHH', header[6:14])
+                return ("Aseprite", width, height,
+                        f"{ASEPRITE_COLOR_DEPTHS.get(depth, f'{depth}-bit')}, {frames} frame{'s' if frames != 1 else ''}")
+        
+        return None
+    
+    @staticmethod
+    def _read_gif_metadata(file, header: bytes) -> Tuple[str, int, int, str]:
+        """Read GIF dimensions and count frames by skipping over data sub-blocks."""
+        width, height, packed = struct.unpack('<HHB', header[6:11])
+        colors = 2 ** ((packed & 0x07) + 1)
+        
+        # Walk the block structure without decompressing image data
+        file.seek(13 + (3 * colors if packed & 0x80 else 0))
+        frames = 0
+        while True:
+            block = file.read(1)
+            if not block or block == b'\x3b':  # Trailer
+                break
+            if block == b'\x2c':  # Image descriptor
+                frames += 1
+                descriptor = file.read(9)
+                if len(descriptor) < 9:
+                    break
+                if descriptor[8] & 0x80:
+                    file.seek(3 * 2 ** ((descriptor[8] & 0x07) + 1), os.SEEK_CUR)
+                file.read(1)  # LZW minimum code size
+            elif block == b'\x21':  # Extension
+                file.read(1)
+            else:
+                break
+            
+            # Skip data sub-blocks up to the zero-length terminator
+            while True:
+                length = file.read(1)
+                if not length or length == b'\x00':
+                    break
+                file.seek(length[0], os.SEEK_CUR)
+        
+        palette = f"{colors} colors" if packed & 0x80 else "local palettes"
+        return ("GIF", width, height, f"{palette}, {frames} frame{'s' if frames != 1 else ''}")
+    
+    @staticmethod
+    def _read_webp_metadata(file, header: bytes) -> Optional[Tuple[str, int, int, str]]:
+        """Read WebP dimensions from the first chunk (VP8, VP8L or VP8X)."""
+        chunk = header[12:16]
+        if chunk == b'VP8X':
+            flags = header[20]
+            width = 1 + int.from_bytes(header[24:27], 'little')
+            height = 1 + int.from_bytes(header[27:30], 'little')
+            details = ["extended", "alpha" if flags & 0x10 else "opaque"]
+            if flags & 0x02:
+                details.append("animated")
+            return ("WebP", width, height, ", ".join(details))
+        if chunk == b'VP8 ':
+            width, height = struct.unpack('<HH', header[26:30])
+            return ("WebP", width & 0x3FFF, height & 0x3FFF, "lossy")
+        if chunk == b'VP8L':
+            bits = struct.unpack('<I', header[21:25])[0]
+            alpha = ", alpha" if (bits >> 28) & 1 else ""
+            return ("WebP", 1 + (bits & 0x3FFF), 1 + ((bits >> 14) & 0x3FFF), f"lossless{alpha}")
+        return None
+    
+    @staticmethod
+    def _read_psd_metadata(file, header: bytes) -> Tuple[str, int, int, str]:
+        """Read PSD dimensions and color mode, then seek past the leading sections to the layer count."""
+        channels, height, width, depth, mode = struct.unpack('>HIIHH', header[12:26])
+        details = f"{PSD_COLOR_MODES.get(mode, f'mode {mode}')}, {depth}-bit, {channels} channels"
+        
+        # Skip color mode data and image resources, then read the layer info header
+        file.seek(26)
+        for _ in range(2):
+            section = file.read(4)
+            if len(section) < 4:
+                return ("PSD", width, height, details)
+            file.seek(struct.unpack('>I', section)[0], os.SEEK_CUR)
+        
+        # Empty layer and mask or layer info sections mean a flattened image
+        layer_header = file.read(10)
+        if len(layer_header) < 8:
+            return ("PSD", width, height, details)
+        section_length, layer_info_length = struct.unpack('>II', layer_header[:8])
+        if section_length == 0 or layer_info_length == 0 or len(layer_header) < 10:
+            return ("PSD", width, height, details + ", flattened")
+        layers = abs(struct.unpack('>h', layer_header[8:10])[0])
+        details += f", {layers} layer{'s' if layers != 1 else ''}"
+        return ("PSD", width, height, details)
     
     def _is_document_file(self, file_path: Path) -> bool:
         """Check if a file is a supported document type."""
@@ -429,24 +1792,27 @@ class Scanner:
             
         # Check for binary indicators
         try:
-            with open(file_path, 'rb') as file:
-                chunk = file.read(4096)
-                
-                # Check for NULL bytes (common in binary files)
-                if b'\x00' in chunk:
-                    return True
-                    
-                # Calculate percentage of printable ASCII characters
-                printable = sum(32 <= b <= 126 or b in (9, 10, 13) for b in chunk)
-                if chunk and printable / len(chunk) < 0.7:
-                    return True
-                    
-                return False
+            with self._open_source(file_path, binary=True) as file:
+                return self._is_binary_chunk(file.read(4096))
         except Exception as e:
             # If we can't read it, report the error and assume binary to be safe
             print(f"Warning: Error reading file {file_path}: {e}")
             return True
     
+    @staticmethod
+    def _is_binary_chunk(chunk: bytes) -> bool:
+        """Check if the first bytes of a file look binary."""
+        # Check for NULL bytes (common in binary files)
+        if b'\x00' in chunk:
+            return True
+            
+        # Calculate percentage of printable ASCII characters
+        printable = sum(32 <= b <= 126 or b in (9, 10, 13) for b in chunk)
+        if chunk and printable / len(chunk) < 0.7:
+            return True
+            
+        return False
+    
     def _process_text_file(self, file_path: Path, output_file: TextIO) -> None:
         """Process and display text file contents."""
         output_file.write(f"\n{'=' * 40}\n")
@@ -454,7 +1820,7 @@ class Scanner:
         output_file.write(f"{'=' * 40}\n")
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
+            with self._open_source(file_path) as file:
                 # Read lines with limit if specified
                 if self.config.max_line_count is not None:
                     lines = []
@@ -474,6 +1840,158 @@ class Scanner:
         except UnicodeDecodeError:
             raise ScannerError(f"File contains non-UTF-8 characters or is binary: {file_path}")
     
+    def _process_outline_file(self, file_path: Path, output_file: TextIO) -> None:
+        """Process a source file by writing only its declarations with line numbers."""
+        with self._open_source(file_path) as file:
+            entries, total_lines = self._outline_gdscript(file)
+        
+        output_file.write(f"\n{'=' * 40}\n")
+        output_file.write(f"Outline of {file_path} ({len(entries)} declarations, {total_lines} lines):\n")
+        output_file.write(f"{'=' * 40}\n")
+        
+        width = len(str(total_lines))
+        for line_number, text in entries:
+            output_file.write(f"  {line_number:>{width}}: {text}\n")
+    
+    @staticmethod
+    def _split_gd_code(line: str) -> Tuple[str, int, Optional[str]]:
+        """
+        Strip a trailing comment from a GDScript line and count its open brackets.
+        
+        A triple-quoted string left open at the end of the line is cut after
+        its opening quotes.
+        
+        Returns:
+            Tuple of (code without comment, net bracket depth change,
+            quotes of the string left open or None)
+        """
+        masked = []
+        position = 0
+        open_quotes = None
+        for match in GDSCRIPT_STRING_PATTERN.finditer(line):
+            masked.append(line[position:match.start()])
+            if match.group().startswith('#'):
+                line = line[:match.start()]
+                break
+            if match.group('open'):
+                open_quotes = match.group('open')
+                line = line[:match.start() + 3]
+                break
+            masked.append('_' * len(match.group()))
+            position = match.end()
+        else:
+            masked.append(line[position:])
+        
+        masked = ''.join(masked)
+        depth = sum(masked.count(c) for c in '([{') - sum(masked.count(c) for c in ')]}')
+        return line.rstrip(), depth, open_quotes
+    
+    def _outline_gdscript(self, lines) -> Tuple[List[Tuple[int, str]], int]:
+        """
+        Extract the declarations of a GDScript file in a single pass.
+        
+        Function bodies and multi-line values are skipped; multi-line
+        signatures and enums are joined onto one line.
+        
+        Args:
+            lines: Iterable of source lines
+            
+        Returns:
+            Tuple of (list of (line number, declaration) pairs, total line count)
+        """
+        entries = []
+        func_indent = None      # Indentation of the function whose body is being skipped
+        pending = None          # [line number, prefix, text, depth, is_func] of an unfinished declaration
+        skip_depth = 0          # Open brackets of a multi-line value being skipped
+        string_quotes = None    # Quotes of a multi-line string being skipped
+        export_annotation = None
+        line_number = 0
+        
+        for line_number, raw_line in enumerate(lines, 1):
+            stripped = raw_line.strip()
+            
+            # Skip multi-line strings; only code after the closing quotes counts
+            if string_quotes is not None:
+                string_end = GDSCRIPT_STRING_END_PATTERNS[string_quotes].match(stripped)
+                if string_end is None:
+                    continue
+                code, depth, string_quotes = self._split_gd_code(stripped[string_end.end():])
+                if pending is None and skip_depth == 0:
+                    continue
+            else:
+                code, depth, string_quotes = self._split_gd_code(stripped)
+            
+            if pending is not None:
+                pending[2] = f"{pending[2]} {code}" if code else pending[2]
+                pending[3] += depth
+                if pending[3] <= 0:
+                    entries.append((pending[0], pending[1] + self._finish_gd_declaration(pending[2], pending[4])))
+                    pending = None
+                continue
+            
+            if skip_depth > 0:
+                skip_depth += depth
+                continue
+            
+            if not code:
+                continue
+            
+            indent = len(raw_line) - len(raw_line.lstrip())
+            if func_indent is not None:
+                if indent > func_indent:
+                    continue
+                func_indent = None
+            
+            # A bare export annotation applies to the var on the following line
+            if GDSCRIPT_EXPORT_ANNOTATION_PATTERN.match(code):
+                export_annotation = (line_number, code)
+                continue
+            if export_annotation is not None and code.startswith('var '):
+                line_number_start, annotation = export_annotation
+                export_annotation = None
+                prefix = raw_line[:indent].replace('\t', '  ')
+                entries.append((line_number_start, f"{prefix}{annotation} {code}"
+                                                    f"{' ...' if depth > 0 or string_quotes else ''}"))
+                skip_depth = depth
+                continue
+            export_annotation = None
+            
+            if not GDSCRIPT_DECLARATION_PATTERN.match(code):
+                continue
+            
+            prefix = raw_line[:indent].replace('\t', '  ')
+            is_func = code.startswith(('func', 'static'))
+            if is_func:
+                func_indent = indent
+            
+            if is_func or code.startswith(('enum', 'signal')):
+                # Join signatures, signal parameters and enum bodies spanning several lines
+                if depth > 0:
+                    pending = [line_number, prefix, code, depth, is_func]
+                else:
+                    entries.append((line_number, prefix + self._finish_gd_declaration(code, is_func)))
+            else:
+                # Show only the first line of multi-line constant/variable values
+                entries.append((line_number, f"{prefix}{code}{' ...' if depth > 0 or string_quotes else ''}"))
+                skip_depth = depth
+        
+        if pending is not None:
+            entries.append((pending[0], pending[1] + self._finish_gd_declaration(pending[2], pending[4])))
+        
+        return entries, line_number
+    
+    @staticmethod
+    def _finish_gd_declaration(text: str, is_func: bool) -> str:
+        """Normalize a joined declaration, reducing functions to their signature."""
+        text = re.sub(r'\s+', ' ', text)
+        text = re.sub(r'([(\[{]) ', r'\1', text)
+        text = re.sub(r' ([)\]}])', r'\1', text)
+        if is_func:
+            match = GDSCRIPT_FUNC_SIGNATURE_PATTERN.match(text)
+            if match:
+                return match.group(1) + (f" {match.group(2)}" if match.group(2) else "")
+        return text
+    
     def _process_document(self, file_path: Path, output_file: TextIO) -> None:
         """Process document files (PDF, Word, Excel, PowerPoint)."""
         doc_type = file_path.suffix.upper()[1:]  # Get extension without dot, uppercase
@@ -483,7 +2001,13 @@ class Scanner:
         output_file.write(f"{'=' * 40}\n")
         
         try:
-            doc_text = self._extract_document_text(file_path)
+            # Share extraction results for working tree files when a cache is provided
+            if self.document_cache is not None and self._is_working_tree_file(file_path):
+                doc_text = self.document_cache.get_or_extract(
+                    file_path, lambda: self._extract_document_text(file_path)
+                )
+            else:
+                doc_text = self._extract_document_text(file_path)
             
             # Apply line limits if specified
             if self.config.max_line_count is not None:
@@ -528,7 +2052,7 @@ class Scanner:
             from PyPDF2 import PdfReader
             
             text_parts = []
-            with open(file_path, 'rb') as file:
+            with self._open_source(file_path, binary=True) as file:
                 pdf_reader = PdfReader(file)
                 num_pages = len(pdf_reader.pages)
                 
@@ -547,7 +2071,7 @@ class Scanner:
         try:
             import docx
             
-            doc = docx.Document(file_path)
+            doc = docx.Document(self._document_source(file_path))
             text_parts = []
             
             # Extract document properties
@@ -583,7 +2107,7 @@ class Scanner:
         try:
             import openpyxl
             
-            workbook = openpyxl.load_workbook(file_path, data_only=True)
+            workbook = openpyxl.load_workbook(self._document_source(file_path), data_only=True)
             text_parts = []
             
             text_parts.append(f"--- Workbook Properties ---")
@@ -629,7 +2153,7 @@ class Scanner:
         try:
             from pptx import Presentation
             
-            presentation = Presentation(file_path)
+            presentation = Presentation(self._document_source(file_path))
             text_parts = []
             
             text_parts.append(f"--- Presentation Properties ---")
@@ -661,11 +2185,44 @@ class Scanner:
             raise ScannerError(f"Error extracting text from PowerPoint file: {str(e)}")
 
 
-def create_default_config(directory_path: str, output_file_path: str, 
-                         filter_mode: FilterMode = DEFAULT_FILTER_MODE) -> ScannerConfig:
-    """Create a scanner configuration with default values."""
+class _LatencyScanner(Scanner):
+    """Scanner whose directory listings and stat calls are delayed like a network filesystem."""
+    
+    def __init__(self, config: ScannerConfig, latency_seconds: float):
+        super().__init__(config)
+        self.latency_seconds = latency_seconds
+    
+    def _read_directory(self, directory: Path, with_stat: bool = False):
+        entries = Scanner._read_directory(directory, with_stat)
+        # One round trip for the listing plus one per stat call
+        round_trips = 1 + sum(1 for _, _, stat in entries if stat is not None)
+        time.sleep(self.latency_seconds * round_trips)
+        return entries
+
+
+def benchmark_parallel_walk(directory: str, latency_ms: float = 2.0,
+                            worker_counts: Tuple[int, ...] = (1, 4, 8, 16)) -> str:
+    """
+    Time the structure walk with simulated per-call filesystem latency.
+    
+    Every directory listing (and stat call) sleeps for the given latency, as a
+    local stand-in for NFS. Each run writes only the directory structure and
+    is checked against the single-threaded report.
     
-    # Create document support with explicit settings
+    Args:
+        directory: Directory to walk
+        latency_ms: Simulated latency per filesystem round trip in milliseconds
+        worker_counts: Walker thread counts to compare (1 = serial walk)
+        
+    Returns:
+        Text table of walk times and speedups
+    """
+    lines = [f"Simulated latency: {latency_ms:g} ms per round trip",
+             f"{'Workers':>8}  {'Time':>8}  {'Speedup':>8}  Report"]
+    baseline_time = None
+    baseline_report = None
+    
+    # Shared between all runs so the document libraries are probed once
     doc_support = DocumentSupport(
         pdf_enabled=DEFAULT_DOC_SUPPORT_ENABLED,
         word_enabled=DEFAULT_DOC_SUPPORT_ENABLED,
@@ -673,6 +2230,43 @@ def create_default_config(directory_path: str, output_file_path: str,
         powerpoint_enabled=DEFAULT_DOC_SUPPORT_ENABLED
     )
     
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for workers in worker_counts:
+            config = create_default_config(directory, str(Path(temp_dir) / f"walk_{workers}.txt"),
+                                           doc_support=doc_support)
+            config.show_contents = False
+            config.walk_workers = workers
+            
+            start = time.perf_counter()
+            _LatencyScanner(config, latency_ms / 1000).scan()
+            elapsed = time.perf_counter() - start
+            
+            # Compare the structure section only (the header and footer contain timestamps)
+            report = config.output_file_path.read_text(encoding='utf-8')
+            structure = report[report.index("DIRECTORY STRUCTURE"):report.index("File contents skipped")]
+            if baseline_report is None:
+                baseline_time, baseline_report = elapsed, structure
+            
+            matches = "identical" if structure == baseline_report else "DIFFERS"
+            lines.append(f"{workers:>8}  {elapsed:>7.2f}s  {baseline_time / elapsed:>7.1f}x  {matches}")
+    
+    return "\n".join(lines)
+
+
+def create_default_config(directory_path: str, output_file_path: str, 
+                         filter_mode: FilterMode = DEFAULT_FILTER_MODE,
+                         doc_support: Optional[DocumentSupport] = None) -> ScannerConfig:
+    """Create a scanner configuration with default values."""
+    
+    # Create document support with explicit settings unless one is shared
+    if doc_support is None:
+        doc_support = DocumentSupport(
+            pdf_enabled=DEFAULT_DOC_SUPPORT_ENABLED,
+            word_enabled=DEFAULT_DOC_SUPPORT_ENABLED,
+            excel_enabled=DEFAULT_DOC_SUPPORT_ENABLED,
+            powerpoint_enabled=DEFAULT_DOC_SUPPORT_ENABLED
+        )
+    
     # Create and validate scanner configuration
     config = ScannerConfig(
         directory=Path(directory_path),
@@ -688,11 +2282,250 @@ def create_default_config(directory_path: str, output_file_path: str,
         show_contents=True,
         max_file_size_kb=DEFAULT_MAX_FILE_SIZE_KB,
         max_line_count=DEFAULT_MAX_LINE_COUNT,
-        doc_support=doc_support
+        doc_support=doc_support,
+        outline_extensions=DEFAULT_OUTLINE_EXTENSIONS.copy(),
+        scan_archives=DEFAULT_SCAN_ARCHIVES,
+        show_asset_summary=DEFAULT_SHOW_ASSET_SUMMARY,
+        show_directory_aggregates=DEFAULT_SHOW_DIRECTORY_AGGREGATES
     )
     
     return config
 
+def _parse_list_option(options: Dict[str, Any], name: str, default: Optional[str] = None) -> List[str]:
+    """
+    Read an optional comma-separated (or list) option into stripped items.
+    
+    Args:
+        options: Option values keyed by option name
+        name: Option name (with underscores)
+        default: Value used when the option is given without a value, if the option allows that
+        
+    Returns:
+        The listed items, empty if the option is not set
+        
+    Raises:
+        ScannerConfigError: If the value is neither a string nor a list of strings
+    """
+    value = options.get(name)
+    if value is None or value is False:
+        return []
+    if value is True and default is not None:
+        value = default
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ScannerConfigError(f"Option '{name.replace('_', '-')}' must be a comma-separated string or a list, "
+                                 f"got {value!r}")
+    return [item.strip() for item in value if item.strip()]
+
+
+def _parse_bool_option(options: Dict[str, Any], name: str) -> bool:
+    """
+    Read an optional on/off option.
+    
+    Raises:
+        ScannerConfigError: If the value is not a boolean
+    """
+    value = options.get(name)
+    if value is None:
+        return False
+    if not isinstance(value, bool):
+        raise ScannerConfigError(f"Option '{name.replace('_', '-')}' must be true or false, got {value!r}")
+    return value
+
+
+def _parse_int_option(options: Dict[str, Any], name: str, default: int) -> Optional[int]:
+    """
+    Read an optional integer option, mapping a bare flag (True) to its default.
+    
+    Args:
+        options: Option values keyed by option name
+        name: Option name (with underscores)
+        default: Value used when the option is given without a value
+        
+    Returns:
+        The integer value, or None if the option is not set
+        
+    Raises:
+        ScannerConfigError: If the value is neither a flag nor an integer
+    """
+    value = options.get(name)
+    if value is None or value is False:
+        return None
+    if value is True:
+        return default
+    if not isinstance(value, int):
+        raise ScannerConfigError(f"Option '{name.replace('_', '-')}' must be an integer, got {value!r}")
+    return value
+
+
+def create_config_from_options(directory_path: str, output_file_path: str, options: Dict[str, Any],
+                               doc_support: Optional[DocumentSupport] = None) -> ScannerConfig:
+    """
+    Create a scanner configuration from command-line style options.
+    
+    Args:
+        directory_path: Directory to scan
+        output_file_path: Path for the output report
+        options: Option values keyed by command-line option name (e.g. 'include', 'extensions', 'outline')
+        doc_support: Optional document support shared between configurations
+        
+    Returns:
+        Validated scanner configuration
+    """
+    options = {key.replace("-", "_"): value for key, value in options.items()}
+    
+    # Set filter mode based on options
+    filter_mode = FilterMode.INCLUDE if _parse_bool_option(options, "include") else FilterMode.EXCLUDE
+    
+    # Create a config with default options
+    config = create_default_config(directory_path, output_file_path, filter_mode, doc_support)
+    
+    # Update extensions if provided
+    extensions = _parse_list_option(options, "extensions")
+    if extensions:
+        # Ensure all extensions have a dot prefix
+        ext_list = [ext if ext.startswith(".") else f".{ext}" for ext in extensions]
+        
+        if filter_mode == FilterMode.INCLUDE:
+            config.included_extensions = set(ext_list)
+        else:  # EXCLUDE mode
+            config.excluded_extensions = set(ext_list)
+            
+    # Update excluded files if provided
+    excluded_files = _parse_list_option(options, "exclude_files")
+    if excluded_files:
+        config.excluded_files = set(excluded_files)
+        
+    # Update included files if provided
+    included_files = _parse_list_option(options, "include_files")
+    if included_files:
+        config.included_files = set(included_files)
+        
+    # Update outlined extensions if provided
+    outline = _parse_list_option(options, "outline", DEFAULT_OUTLINE_FLAG_VALUE)
+    if outline:
+        config.outline_extensions = {ext if ext.startswith(".") else f".{ext}" for ext in outline}
+        
+    # Update git options if provided
+    config.git_mode = _parse_bool_option(options, "git")
+    config.git_since = options.get("since")
+    config.git_revision = options.get("revision")
+    
+    # Update archive scanning if requested
+    if _parse_bool_option(options, "archives"):
+        config.scan_archives = True
+    
+    # Update asset summary if requested
+    if _parse_bool_option(options, "assets"):
+        config.show_asset_summary = True
+    
+    # Update directory aggregates if requested
+    if _parse_bool_option(options, "aggregates"):
+        config.show_directory_aggregates = True
+    config.collapse_threshold = _parse_int_option(options, "collapse", DEFAULT_COLLAPSE_THRESHOLD)
+    
+    # Update parallel traversal if requested
+    config.walk_workers = _parse_int_option(options, "walk_workers", DEFAULT_WALK_WORKERS)
+    
+    # Update checkpoint settings if requested
+    config.checkpoint_interval = _parse_int_option(options, "checkpoint", DEFAULT_CHECKPOINT_INTERVAL)
+    config.resume = _parse_bool_option(options, "resume")
+    
+    # Update delta scan settings if provided
+    config.delta_manifest = options.get("delta")
+    config.save_manifest = options.get("save_manifest")
+    
+    # Re-run validation for the updated settings
+    config.__post_init__()
+    
+    return config
+
+
+@dataclass
+class BatchJobResult:
+    """Outcome of a single job in a batch scan."""
+    directory: str
+    output_file_path: str
+    success: bool
+    elapsed_seconds: float
+    error: Optional[str] = None
+
+
+def run_batch(manifest_path: str, max_workers: int = DEFAULT_BATCH_WORKERS,
+              io_limit: int = DEFAULT_BATCH_IO_LIMIT) -> List[BatchJobResult]:
+    """
+    Run the scan jobs listed in a manifest concurrently in this process.
+    
+    The manifest is a JSON list (or an object with a "jobs" list) of entries
+    with "root", "output" and an optional "config" object using the
+    command-line option names, e.g. {"include": true, "extensions": "gd", "outline": ".gd"}.
+    All jobs share one worker pool, one document extraction cache and one
+    limit on concurrently read files.
+    
+    Args:
+        manifest_path: Path to the JSON manifest
+        max_workers: Number of jobs scanned concurrently
+        io_limit: Number of files read concurrently across all jobs
+        
+    Returns:
+        List of job results in manifest order
+    """
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ScannerConfigError(f"Unable to read batch manifest {manifest_path}: {e}")
+    
+    jobs = manifest.get("jobs", []) if isinstance(manifest, dict) else manifest
+    if not isinstance(jobs, list) or not all(isinstance(job, dict) and "root" in job and "output" in job
+                                             for job in jobs):
+        raise ScannerConfigError("Batch manifest must list jobs with 'root' and 'output' entries")
+    if max_workers <= 0 or io_limit <= 0:
+        raise ScannerConfigError("Batch workers and IO limit must be positive")
+    
+    # Shared between all jobs
+    doc_support = DocumentSupport(
+        pdf_enabled=DEFAULT_DOC_SUPPORT_ENABLED,
+        word_enabled=DEFAULT_DOC_SUPPORT_ENABLED,
+        excel_enabled=DEFAULT_DOC_SUPPORT_ENABLED,
+        powerpoint_enabled=DEFAULT_DOC_SUPPORT_ENABLED
+    )
+    document_cache = DocumentCache()
+    io_limiter = threading.BoundedSemaphore(io_limit)
+    
+    def run_job(job: Dict[str, Any]) -> BatchJobResult:
+        start = time.perf_counter()
+        try:
+            config = create_config_from_options(job["root"], job["output"], job.get("config", {}), doc_support)
+            Scanner(config, document_cache=document_cache, io_limiter=io_limiter).scan()
+        except (ScannerConfigError, ScannerError) as e:
+            return BatchJobResult(job["root"], job["output"], False, time.perf_counter() - start, str(e))
+        except Exception as e:
+            return BatchJobResult(job["root"], job["output"], False, time.perf_counter() - start,
+                                  f"Unexpected error: {e}")
+        return BatchJobResult(job["root"], job["output"], True, time.perf_counter() - start)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run_job, jobs))
+
+
+def format_batch_summary(results: List[BatchJobResult], total_seconds: float) -> str:
+    """Format per-job timings of a batch scan as a text table."""
+    lines = ["BATCH SUMMARY", "=" * 50]
+    for result in results:
+        status = "OK" if result.success else "FAILED"
+        line = f"{status:<7} {result.elapsed_seconds:8.2f}s  {result.directory} -> {result.output_file_path}"
+        if result.error:
+            line += f" ({result.error})"
+        lines.append(line)
+    
+    failed = sum(1 for result in results if not result.success)
+    lines.append("=" * 50)
+    lines.append(f"{len(results)} jobs, {failed} failed, {total_seconds:.2f}s total")
+    return "\n".join(lines)
+
+
 def scan_core_scripts(base_dir: str, output_file_path: str) -> None:
     """
     Scan the core script directories in inclusion mode and combine the results.
@@ -796,6 +2629,7 @@ def main() -> int:
     Main entry point for the scanner.
     Configure all settings here and run the scanner.
     """
+    config = None
     try:
         # ====================================================================
         # CONFIGURATION
@@ -812,6 +2646,47 @@ def main() -> int:
                           help="Comma-separated list of specific files to exclude (e.g., 'base_level.tscn,player.gd')")
         parser.add_argument("--include-files", "-if", type=str,
                           help="Comma-separated list of specific files to include regardless of extension")
+        parser.add_argument("--outline", "-o", type=str, nargs="?", const=DEFAULT_OUTLINE_FLAG_VALUE,
+                          help="Comma-separated list of extensions to show as declaration outlines "
+                               "instead of full contents (default when given without value: .gd)")
+        parser.add_argument("--git", action="store_true",
+                          help="Take the file list from git (tracked files only) instead of walking the directory")
+        parser.add_argument("--since", type=str, metavar="REF",
+                          help="Git mode: only scan files changed since the given ref")
+        parser.add_argument("--revision", type=str, metavar="REV",
+                          help="Git mode: read files from the given revision instead of the working tree")
+        parser.add_argument("--archives", action="store_true",
+                          help="List and read .zip/.tar archives as virtual directories without extracting them")
+        parser.add_argument("--assets", action="store_true",
+                          help="Add a per-directory table of image/art source dimensions read from file headers")
+        parser.add_argument("--aggregates", action="store_true",
+                          help="Show file count, total size and extension breakdown for each directory")
+        parser.add_argument("--collapse", type=int, nargs="?", const=DEFAULT_COLLAPSE_THRESHOLD, metavar="N",
+                          help=f"Collapse directories directly containing more than N files into one summary line "
+                               f"(default when given without value: {DEFAULT_COLLAPSE_THRESHOLD}; implies --aggregates)")
+        parser.add_argument("--walk-workers", type=int, nargs="?", const=DEFAULT_WALK_WORKERS, metavar="N",
+                          help=f"List directories with N walker threads, e.g. on network filesystems "
+                               f"(default when given without value: {DEFAULT_WALK_WORKERS})")
+        parser.add_argument("--checkpoint", type=int, nargs="?", const=DEFAULT_CHECKPOINT_INTERVAL, metavar="N",
+                          help=f"Write a resumable checkpoint every N processed files "
+                               f"(default when given without value: {DEFAULT_CHECKPOINT_INTERVAL})")
+        parser.add_argument("--resume", action="store_true",
+                          help="Continue an interrupted scan from its last checkpoint")
+        parser.add_argument("--save-manifest", type=str, metavar="PATH",
+                          help="Save a manifest of this scan (sizes, times, hashes, text) for later delta scans")
+        parser.add_argument("--delta", type=str, metavar="MANIFEST",
+                          help="Only report files added, removed or modified since the scan saved in MANIFEST")
+        parser.add_argument("--batch", type=str, metavar="MANIFEST",
+                          help="Run the jobs of a JSON manifest concurrently in one process")
+        parser.add_argument("--workers", type=int, default=DEFAULT_BATCH_WORKERS,
+                          help=f"Batch mode: number of jobs scanned concurrently (default: {DEFAULT_BATCH_WORKERS})")
+        parser.add_argument("--io-limit", type=int, default=DEFAULT_BATCH_IO_LIMIT,
+                          help=f"Batch mode: files read concurrently across all jobs (default: {DEFAULT_BATCH_IO_LIMIT})")
+        parser.add_argument("--benchmark-catalog", action="store_true",
+                          help="Measure memory use of the file catalog against a Path list at 100k and 1M files")
+        parser.add_argument("--benchmark-walk", type=float, nargs="?", const=2.0, metavar="LATENCY_MS",
+                          help="Time serial and parallel walks of the directory with simulated filesystem latency "
+                               "(default when given without value: 2 ms)")
         parser.add_argument("--scan-core", action="store_true", 
                           help="Scan core script directories (projectiles, base_classes, enemies)")
         
@@ -821,33 +2696,27 @@ def main() -> int:
         if args.scan_core:
             scan_core_scripts(args.directory, args.output)
             return 0
-        
-        # Set filter mode based on arguments
-        filter_mode = FilterMode.INCLUDE if args.include else FilterMode.EXCLUDE
-        
-        # Create a config with default options
-        config = create_default_config(args.directory, args.output, filter_mode)
-        
-        # Update extensions based on command-line argument if provided
-        if args.extensions:
-            ext_list = [ext.strip() for ext in args.extensions.split(",")]
-            # Ensure all extensions have a dot prefix
-            ext_list = [ext if ext.startswith(".") else f".{ext}" for ext in ext_list]
             
-            if filter_mode == FilterMode.INCLUDE:
-                config.included_extensions = set(ext_list)
-            else:  # EXCLUDE mode
-                config.excluded_extensions = set(ext_list)
-                
-        # Update excluded files if provided
-        if args.exclude_files:
-            excluded_files = [file.strip() for file in args.exclude_files.split(",")]
-            config.excluded_files = set(excluded_files)
+        # Special mode: Benchmark the file catalog
+        if args.benchmark_catalog:
+            print(benchmark_file_catalog())
+            return 0
             
-        # Update included files if provided
-        if args.include_files:
-            included_files = [file.strip() for file in args.include_files.split(",")]
-            config.included_files = set(included_files)
+        # Special mode: Benchmark parallel traversal
+        if args.benchmark_walk is not None:
+            print(benchmark_parallel_walk(args.directory, args.benchmark_walk))
+            return 0
+            
+        # Special mode: Run a batch of scans
+        if args.batch:
+            print(f"Running batch scan from manifest: {args.batch}")
+            start = time.perf_counter()
+            results = run_batch(args.batch, args.workers, args.io_limit)
+            print(format_batch_summary(results, time.perf_counter() - start))
+            return 0 if all(result.success for result in results) else 1
+        
+        # Create a config from the command-line options
+        config = create_config_from_options(args.directory, args.output, vars(args))
         
         # Create and run the scanner
         print(f"Scanning directory: {config.directory.absolute()}")
@@ -865,6 +2734,37 @@ def main() -> int:
         if config.included_files:
             print(f"Including specific files: {', '.join(sorted(config.included_files))}")
             
+        if config.outline_extensions:
+            print(f"Outlining extensions: {', '.join(sorted(config.outline_extensions))}")
+            
+        if config.scan_archives:
+            print("Scanning archives as virtual directories")
+            
+        if config.show_asset_summary:
+            print("Including asset summary")
+            
+        if config.git_mode:
+            print(f"Git mode: tracked files"
+                  f"{f' changed since {config.git_since}' if config.git_since else ''}"
+                  f"{f' at revision {config.git_revision}' if config.git_revision else ''}")
+            
+        if config.collapse_threshold is not None:
+            print(f"Collapsing directories with more than {config.collapse_threshold} files")
+        elif config.show_directory_aggregates:
+            print("Showing directory aggregates")
+            
+        if config.walk_workers is not None and config.walk_workers > 1:
+            print(f"Walking directories with {config.walk_workers} threads")
+            
+        if config.delta_manifest is not None:
+            print(f"Delta scan against manifest: {config.delta_manifest}")
+            
+        if config.save_manifest is not None:
+            print(f"Saving scan manifest to {config.save_manifest}")
+            
+        if config.checkpoint_interval is not None:
+            print(f"Checkpointing every {config.checkpoint_interval} files to {config.checkpoint_path}")
+            
         print("Scanning in progress...")
         
         scanner = Scanner(config)
@@ -875,6 +2775,8 @@ def main() -> int:
         
     except KeyboardInterrupt:
         print("\nScan interrupted by user.")
+        if config is not None and config.checkpoint_interval is not None:
+            print(f"Run again with --resume to continue from {config.checkpoint_path}")
         return 130
     except ScannerConfigError as e:
         print(f"Configuration error: {str(e)}")